@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
 
@@ -10,14 +8,21 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "production"
     DEBUG: bool = False
     DATABASE_URL: str = "sqlite+aiosqlite:///src/app.db"
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    RESPONSE_CACHE_MAX_AGE: int = 300
+    RESPONSE_CACHE_MAX_SIZE: int = 1024
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
-@lru_cache(maxsize=1)
+_SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return _SETTINGS
@@ -0,0 +1,64 @@
+"""Add timestamp server defaults
+
+Revision ID: dd6fa6aa2097
+Revises: dd75bb27c507
+Create Date: 2026-10-15 11:02:38.176540
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dd6fa6aa2097"
+down_revision: str | None = "dd75bb27c507"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _create_sqlite_fts_triggers() -> None:
+    # SQLite batch operations recreate the table, dropping its full-text search triggers
+    op.execute(
+        """
+        CREATE TRIGGER glossary_terms_fts_insert AFTER INSERT ON glossary_terms BEGIN
+            INSERT INTO glossary_terms_fts(rowid, term, definition) VALUES (new.id, new.term, new.definition);
+        END
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER glossary_terms_fts_delete AFTER DELETE ON glossary_terms BEGIN
+            INSERT INTO glossary_terms_fts(glossary_terms_fts, rowid, term, definition)
+            VALUES ('delete', old.id, old.term, old.definition);
+        END
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER glossary_terms_fts_update AFTER UPDATE OF term, definition ON glossary_terms BEGIN
+            INSERT INTO glossary_terms_fts(glossary_terms_fts, rowid, term, definition)
+            VALUES ('delete', old.id, old.term, old.definition);
+            INSERT INTO glossary_terms_fts(rowid, term, definition) VALUES (new.id, new.term, new.definition);
+        END
+        """,
+    )
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("glossary_terms") as batch_op:
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), server_default=sa.func.now())
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), server_default=sa.func.now())
+
+    if op.get_bind().dialect.name == "sqlite":
+        _create_sqlite_fts_triggers()
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("glossary_terms") as batch_op:
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(), server_default=None)
+        batch_op.alter_column("created_at", existing_type=sa.DateTime(), server_default=None)
+
+    if op.get_bind().dialect.name == "sqlite":
+        _create_sqlite_fts_triggers()
@@ -0,0 +1,73 @@
+"""Add glossary terms full-text search
+
+Revision ID: dd75bb27c507
+Revises: 95d2780e631d
+Create Date: 2026-10-15 10:24:17.402913
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dd75bb27c507"
+down_revision: str | None = "95d2780e631d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.create_index(
+            "ix_glossary_terms_search_vector",
+            "glossary_terms",
+            [sa.text("to_tsvector('simple', term || ' ' || definition)")],
+            postgresql_using="gin",
+        )
+    elif dialect == "sqlite":
+        # External content FTS5 table, kept in sync with glossary_terms by triggers
+        op.execute(
+            "CREATE VIRTUAL TABLE glossary_terms_fts "
+            "USING fts5(term, definition, content='glossary_terms', content_rowid='id')",
+        )
+        op.execute(
+            """
+            CREATE TRIGGER glossary_terms_fts_insert AFTER INSERT ON glossary_terms BEGIN
+                INSERT INTO glossary_terms_fts(rowid, term, definition) VALUES (new.id, new.term, new.definition);
+            END
+            """,
+        )
+        op.execute(
+            """
+            CREATE TRIGGER glossary_terms_fts_delete AFTER DELETE ON glossary_terms BEGIN
+                INSERT INTO glossary_terms_fts(glossary_terms_fts, rowid, term, definition)
+                VALUES ('delete', old.id, old.term, old.definition);
+            END
+            """,
+        )
+        op.execute(
+            """
+            CREATE TRIGGER glossary_terms_fts_update AFTER UPDATE OF term, definition ON glossary_terms BEGIN
+                INSERT INTO glossary_terms_fts(glossary_terms_fts, rowid, term, definition)
+                VALUES ('delete', old.id, old.term, old.definition);
+                INSERT INTO glossary_terms_fts(rowid, term, definition) VALUES (new.id, new.term, new.definition);
+            END
+            """,
+        )
+        op.execute("INSERT INTO glossary_terms_fts(glossary_terms_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.drop_index("ix_glossary_terms_search_vector", table_name="glossary_terms")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER glossary_terms_fts_update")
+        op.execute("DROP TRIGGER glossary_terms_fts_delete")
+        op.execute("DROP TRIGGER glossary_terms_fts_insert")
+        op.execute("DROP TABLE glossary_terms_fts")
@@ -16,7 +16,7 @@ class FixtureResult:
 
     @property
     def is_successful(self) -> bool:
-        return self.status == FixtureLoadStatus.SUCCESS
+        return self.status in (FixtureLoadStatus.SUCCESS, FixtureLoadStatus.SKIPPED)
 
     def to_dict(self) -> dict[str, Any]:
         return {
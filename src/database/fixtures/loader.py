@@ -1,23 +1,40 @@
+import asyncio
+import hashlib
 import importlib
-import json
 import logging
+import mmap
+from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import inspect, select
-from sqlalchemy.exc import SQLAlchemyError
+try:
+    from orjson import loads as json_loads
+
+    HAS_ORJSON = True
+except ImportError:
+    from json import loads as json_loads
+
+    HAS_ORJSON = False
+
+from sqlalchemy import ColumnElement, Table, and_, delete, insert, inspect, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.schema import CallableColumnDefault, ScalarElementColumnDefault
 
-from database.models import Base
+from database.models import Base, FixtureState
 
 from .dto import FixtureResult
 from .enums import FixtureLoadStatus
-from .exceptions import FixtureError
 
 
 class FixtureLoader:
     """Handles loading of fixture data into database"""
 
+    # Minimal number of new records to insert with COPY on PostgreSQL (asyncpg)
+    COPY_THRESHOLD = 100
+    # Maximal number of unique keys looked up per query, keeps bound parameters under driver limits
+    LOOKUP_BATCH_SIZE = 1000
+
     def __init__(self, db: AsyncSession, models_module: str, logger: logging.Logger):
         """
         Initialize the fixture loader.
@@ -28,6 +45,7 @@ class FixtureLoader:
         """
         self.db = db
         self.models_module = models_module
+        self._models_module_obj = importlib.import_module(models_module)
         self.logger = logger
         self._models_cache: dict[str, type[Base]] = {}
         self._dependencies: dict[str, set[str]] = {}
@@ -35,23 +53,34 @@ class FixtureLoader:
 
     def _get_model_class(self, model_name: str) -> type[Base] | None:
         """Get model class by name from the models module"""
-        if model_name in self._models_cache:
-            return self._models_cache[model_name]
+        cached_model_class = self._models_cache.get(model_name)
+        if cached_model_class is not None:
+            return cached_model_class
 
-        try:
-            module = importlib.import_module(self.models_module)
-            model_attr = getattr(module, model_name, None)
-
-            if model_attr is not None and isinstance(model_attr, type) and issubclass(model_attr, Base):
-                model_class: type[Base] = model_attr
-                self._models_cache[model_name] = model_class
-                return model_class
+        model_attr = getattr(self._models_module_obj, model_name, None)
+        if model_attr is not None and isinstance(model_attr, type) and issubclass(model_attr, Base):
+            model_class: type[Base] = model_attr
+            self._models_cache[model_name] = model_class
+            return model_class
 
-            self.logger.error(f"Model {model_name} not found or not a SQLAlchemy model")
-        except (ImportError, AttributeError) as e:
-            self.logger.error(f"Failed to load model {model_name}: {e}")
+        self.logger.error(f"Model {model_name} not found or not a SQLAlchemy model")
         return None
 
+    @staticmethod
+    def _read_fixture(fixture_path: Path) -> Any:
+        """Read and decode a fixture file, parsing it straight from a memory map when possible"""
+        with open(fixture_path, "rb", buffering=1 << 20) as f:
+            if HAS_ORJSON:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Empty files and some file systems can't be memory mapped
+                    pass
+                else:
+                    with mapped, memoryview(mapped) as view:
+                        return json_loads(view)
+            return json_loads(f.read())
+
     def _validate_fixture_data(
         self,
         model_class: type[Base],
@@ -62,77 +91,146 @@ class FixtureLoader:
         if not data:
             return False
 
-        # Get model columns
+        if not unique_fields:
+            self.logger.error(f"No unique fields specified for model {model_class.__name__}")
+            return False
+
+        # Get model columns, computed once per fixture rather than per record
         mapper = inspect(model_class)
-        column_names = {c.key for c in mapper.columns}
-        relationship_names = {r.key for r in mapper.relationships}
-        valid_fields = column_names | relationship_names
+        valid_fields = frozenset(c.key for c in mapper.columns) | frozenset(r.key for r in mapper.relationships)
+        required_fields = frozenset(unique_fields)
 
         # Validate each record
         for record in data:
             # Check required fields
-            missing_fields = [field for field in unique_fields if field not in record]
+            missing_fields = required_fields - record.keys()
             if missing_fields:
-                self.logger.error(f"Missing required fields {missing_fields} in record: {record}")
+                self.logger.error(f"Missing required fields {sorted(missing_fields)} in record: {record}")
                 return False
 
             # Check field validity
-            invalid_fields = [field for field in record if field not in valid_fields]
+            invalid_fields = record.keys() - valid_fields
             if invalid_fields:
-                self.logger.error(f"Invalid fields {invalid_fields} for model {model_class.__name__}")
+                self.logger.error(f"Invalid fields {sorted(invalid_fields)} for model {model_class.__name__}")
                 return False
 
         return True
 
-    async def _process_record(
+    async def _get_existing_ids(
         self,
         model_class: type[Base],
-        record: dict[str, Any],
+        data: list[dict[str, Any]],
         unique_fields: list[str],
-        result: FixtureResult,
-    ) -> None:
-        """Process a single record from fixture data"""
-        try:
-            # Create filter conditions for unique fields
-            filter_conditions = [
-                getattr(model_class, field) == record[field] for field in unique_fields if field in record
-            ]
-
-            if not filter_conditions:
-                raise FixtureError(f"No unique fields found in record: {record}")
-
-            # Check if record exists
-            stmt = select(model_class).where(*filter_conditions)
-            existing = await self.db.execute(stmt)
-            obj = existing.scalar_one_or_none()
-
-            if obj:
-                # Update existing record
-                for key, value in record.items():
-                    if hasattr(obj, key):
-                        setattr(obj, key, value)
-                result.updated += 1
-                self.logger.debug(f"Updated existing {model_class.__name__} record: {record}")
-            else:
-                # Create new record
-                obj = model_class(**record)
-                self.db.add(obj)
-                result.created += 1
-                self.logger.debug(f"Created new {model_class.__name__} record: {record}")
+    ) -> dict[tuple[Any, ...], int]:
+        """Fetch ids of all existing records for fixture data in batched queries, keyed by unique fields"""
+        keys = {tuple(record[field] for field in unique_fields) for record in data}
+        columns = [getattr(model_class, field) for field in unique_fields]
+
+        # NULL never matches IN, so keys with None values are compared column by column with IS NULL
+        null_keys = [key for key in keys if None in key]
+        in_keys = list(keys.difference(null_keys))
+
+        conditions: list[ColumnElement[bool]] = []
+        for start in range(0, len(in_keys), self.LOOKUP_BATCH_SIZE):
+            conditions.append(tuple_(*columns).in_(in_keys[start : start + self.LOOKUP_BATCH_SIZE]))
+        for start in range(0, len(null_keys), self.LOOKUP_BATCH_SIZE):
+            conditions.append(
+                or_(
+                    *(
+                        and_(*(column == value for column, value in zip(columns, key)))
+                        for key in null_keys[start : start + self.LOOKUP_BATCH_SIZE]
+                    )
+                )
+            )
 
-        except Exception as e:
-            result.failed += 1
-            result.errors.append(f"Error processing record {record}: {e!s}")
-            self.logger.error(f"Error processing record: {e}")
-            await self.db.rollback()
-            raise
+        existing: dict[tuple[Any, ...], int] = {}
+        for condition in conditions:
+            rows = await self.db.execute(select(model_class.id, *columns).where(condition))
+            existing.update((tuple(row[1:]), row[0]) for row in rows)
+        return existing
+
+    def _split_records(
+        self,
+        data: list[dict[str, Any]],
+        unique_fields: list[str],
+        existing: dict[tuple[Any, ...], int],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Split fixture records into rows to insert and rows to update by primary key"""
+        to_insert: list[dict[str, Any]] = []
+        to_update: list[dict[str, Any]] = []
 
-    async def load_fixture(self, fixture_path: Path) -> FixtureResult:
+        for record in data:
+            existing_id = existing.get(tuple(record[field] for field in unique_fields))
+            if existing_id is None:
+                to_insert.append(record)
+            else:
+                to_update.append({**record, "id": existing_id})
+
+        return to_insert, to_update
+
+    @staticmethod
+    def _get_python_defaults(table: Table, fields: frozenset[str]) -> dict[str, Any]:
+        """Evaluate Python-side column defaults for columns missing from fixture records"""
+        defaults: dict[str, Any] = {}
+        for column in table.columns:
+            if column.key in fields:
+                continue
+            if isinstance(column.default, CallableColumnDefault):
+                defaults[column.key] = column.default.arg(None)  # type: ignore[arg-type]
+            elif isinstance(column.default, ScalarElementColumnDefault):
+                defaults[column.key] = column.default.arg
+        return defaults
+
+    async def _insert_records(self, model_class: type[Base], to_insert: list[dict[str, Any]]) -> None:
+        """Insert new records, streaming large batches with COPY on PostgreSQL (asyncpg)"""
+        conn = await self.db.connection()
+        use_copy = conn.dialect.name == "postgresql" and conn.dialect.driver == "asyncpg"
+        if not use_copy or len(to_insert) <= self.COPY_THRESHOLD:
+            await self.db.execute(insert(model_class), to_insert)
+            return
+
+        # COPY writes every listed column, so records are grouped by their fields
+        # to keep server defaults for missing ones instead of writing explicit NULLs
+        groups: dict[frozenset[str], list[dict[str, Any]]] = defaultdict(list)
+        for record in to_insert:
+            groups[frozenset(record)].append(record)
+
+        # COPY bypasses SQLAlchemy, so Python-side column defaults are filled in here
+        table = cast(Table, model_class.__table__)
+        raw_connection = await conn.get_raw_connection()
+        for fields, records in groups.items():
+            defaults = self._get_python_defaults(table, fields)
+            columns = [column for column in table.columns if column.key in fields or column.key in defaults]
+            await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                table.name,
+                records=[tuple(record.get(c.key, defaults.get(c.key)) for c in columns) for record in records],
+                columns=[column.name for column in columns],
+            )
+
+    async def _write_records(
+        self,
+        model_class: type[Base],
+        data: list[dict[str, Any]],
+        unique_fields: list[str],
+    ) -> tuple[int, int]:
+        """Insert new and update existing fixture records, returning numbers of created and updated ones"""
+        # Fetch existing records in a few batched queries instead of querying per record
+        existing = await self._get_existing_ids(model_class, data, unique_fields)
+        to_insert, to_update = self._split_records(data, unique_fields, existing)
+
+        if to_insert:
+            await self._insert_records(model_class, to_insert)
+        if to_update:
+            await self.db.execute(update(model_class), to_update)
+        return len(to_insert), len(to_update)
+
+    async def load_fixture(self, fixture_path: Path, fixture_data: Any = None) -> FixtureResult:
         """
         Load a single fixture file.
 
         Args:
             fixture_path: Path to the fixture file
+            fixture_data: Already parsed contents of the fixture file, read from disk if not provided
 
         Returns:
             FixtureResult: Result of the loading operation
@@ -140,8 +238,8 @@ class FixtureLoader:
         result = FixtureResult(fixture_path.name)
 
         try:
-            with open(fixture_path, encoding="utf-8") as f:
-                fixture_data = json.load(f)
+            if fixture_data is None:
+                fixture_data = self._read_fixture(fixture_path)
 
             model_name = fixture_data.get("model")
             unique_fields = fixture_data.get("unique_fields", [])
@@ -153,34 +251,38 @@ class FixtureLoader:
             model_class = self._get_model_class(model_name)
             if not model_class:
                 result.errors.append(f"Model {model_name} not found")
+                result.status = FixtureLoadStatus.FAILED
                 return result
 
             # Validate data
             if not self._validate_fixture_data(model_class, data, unique_fields):
                 result.errors.append("Data validation failed")
+                result.status = FixtureLoadStatus.FAILED
                 return result
 
-            # Process records
-            for record in data:
-                try:
-                    await self._process_record(model_class, record, unique_fields, result)
-                except Exception as e:
-                    result.errors.append(str(e))
-
-            # Commit changes
+            # Write all records in a single transaction, rolled back once as a whole on failure
             try:
+                try:
+                    created, updated = await self._write_records(model_class, data, unique_fields)
+                except IntegrityError:
+                    # Records created since the lookup, e.g. through the API while fixtures are loading,
+                    # are found and updated on the second attempt
+                    await self.db.rollback()
+                    created, updated = await self._write_records(model_class, data, unique_fields)
                 await self.db.commit()
-                if result.failed == 0:
-                    result.status = FixtureLoadStatus.SUCCESS
-                else:
-                    result.status = FixtureLoadStatus.PARTIAL
-            except SQLAlchemyError as e:
+            except Exception as e:
                 await self.db.rollback()
-                result.errors.append(f"Commit failed: {e!s}")
+                result.failed = len(data)
+                result.errors.append(f"Writing records failed: {e!s}")
                 result.status = FixtureLoadStatus.FAILED
+            else:
+                result.created = created
+                result.updated = updated
+                result.status = FixtureLoadStatus.SUCCESS
 
         except Exception as e:
             result.errors.append(f"Fixture loading failed: {e!s}")
+            result.status = FixtureLoadStatus.FAILED
             self.logger.error(f"Error loading fixture {fixture_path}: {e}")
 
         # Log results
@@ -195,6 +297,96 @@ class FixtureLoader:
 
         return result
 
+    def _build_dependencies(self, fixtures: dict[str, Any]) -> None:
+        """
+        Build dependencies between fixtures from foreign keys of their models.
+
+        Fixtures writing to the same table depend on the previous one in file name order,
+        so they are loaded one after another rather than racing for the same rows.
+        """
+        fixture_tables: dict[str, Table] = {}
+        for name, fixture_data in sorted(fixtures.items()):
+            if not isinstance(fixture_data, dict):
+                continue
+            model_class = self._get_model_class(fixture_data.get("model", ""))
+            if model_class:
+                fixture_tables[name] = cast(Table, model_class.__table__)
+
+        table_fixtures: dict[str, set[str]] = defaultdict(set)
+        for name, table in fixture_tables.items():
+            table_fixtures[table.name].add(name)
+
+        self._dependencies = {
+            name: {
+                dependency
+                for foreign_key in table.foreign_keys
+                for dependency in table_fixtures.get(foreign_key.column.table.name, set())
+            }
+            - {name}
+            for name, table in fixture_tables.items()
+        }
+
+        previous_fixtures: dict[str, str] = {}
+        for name, table in fixture_tables.items():
+            if table.name in previous_fixtures:
+                self._dependencies[name].add(previous_fixtures[table.name])
+            previous_fixtures[table.name] = name
+
+    def _get_load_layers(self, fixture_names: list[str]) -> list[list[str]]:
+        """Group fixtures into layers, each depending only on fixtures from previous layers"""
+        layers: list[list[str]] = []
+        loaded: set[str] = set()
+        remaining = fixture_names
+
+        while remaining:
+            layer = [name for name in remaining if self._dependencies.get(name, set()) <= loaded]
+            if not layer:
+                self.logger.warning(f"Circular dependencies between fixtures {remaining}, loading them one by one")
+                layers.extend([name] for name in remaining)
+                break
+            layers.append(layer)
+            loaded.update(layer)
+            remaining = [name for name in remaining if name not in loaded]
+
+        return layers
+
+    async def _load_fixture_in_new_session(self, fixture_path: Path, fixture_data: Any) -> FixtureResult:
+        """Load a single fixture using a separate session, so it can run concurrently with others"""
+        async with AsyncSession(self.db.bind, expire_on_commit=False, autoflush=False) as session:
+            loader = FixtureLoader(session, self.models_module, self.logger)
+            return await loader.load_fixture(fixture_path, fixture_data)
+
+    @staticmethod
+    def _get_digest(fixture_path: Path) -> str:
+        """Get SHA-256 digest of a fixture file"""
+        with open(fixture_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    async def _get_loaded_digests(self) -> dict[str, str]:
+        """Get digests of fixture files as of their last successful load"""
+        stmt = select(FixtureState.filename, FixtureState.sha256)
+        result = await self.db.execute(stmt)
+        digests = {filename: sha256 for filename, sha256 in result}
+        # End the read transaction, fixtures may be written from other sessions
+        await self.db.commit()
+        return digests
+
+    async def _save_digests(self, digests: dict[str, str]) -> None:
+        """Remember digests of successfully loaded fixture files"""
+        if not digests:
+            return
+
+        try:
+            await self.db.execute(delete(FixtureState).where(FixtureState.filename.in_(digests)))
+            await self.db.execute(
+                insert(FixtureState),
+                [{"filename": filename, "sha256": sha256} for filename, sha256 in digests.items()],
+            )
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            self.logger.error(f"Failed to save fixture states, fixtures will be loaded again: {e}")
+
     async def load_all_fixtures(self, fixtures_dir: Path, ignore_errors: bool = False) -> dict[str, FixtureResult]:
         """
         Load all fixture files from a directory.
@@ -214,17 +406,69 @@ class FixtureLoader:
 
         self.logger.info(f"Starting to load all fixtures from {fixtures_dir}")
 
-        # Load fixtures in sorted order
-        fixture_files = sorted(fixtures_dir.glob("*.json"))
+        # Skip fixtures that haven't changed since their last successful load
+        fixture_files: dict[str, Path] = {}
+        digests: dict[str, str] = {}
+        loaded_digests = await self._get_loaded_digests()
+        for fixture_file in sorted(fixtures_dir.glob("*.json")):
+            name = fixture_file.name
+            try:
+                digests[name] = self._get_digest(fixture_file)
+            except OSError as e:
+                self.logger.error(f"Error reading fixture {fixture_file}: {e}")
+
+            if name in digests and digests[name] == loaded_digests.get(name):
+                self.logger.info(f"Skipping unchanged fixture: {name}")
+                self.results[name] = FixtureResult(name)
+                self.results[name].status = FixtureLoadStatus.SKIPPED
+            else:
+                fixture_files[name] = fixture_file
 
-        for fixture_file in fixture_files:
-            result = await self.load_fixture(fixture_file)
-            self.results[fixture_file.name] = result
+        # Read fixtures in sorted order
+        fixtures: dict[str, Any] = {}
+        for name, fixture_file in fixture_files.items():
+            try:
+                fixtures[name] = self._read_fixture(fixture_file)
+            except Exception as e:
+                # Leave it to load_fixture to read the file again and report the error
+                self.logger.error(f"Error reading fixture {fixture_file}: {e}")
+                fixtures[name] = None
+
+        # Load independent fixtures concurrently, layer by layer
+        self._build_dependencies(fixtures)
+        for layer in self._get_load_layers(list(fixture_files)):
+            if len(layer) == 1:
+                results: list[FixtureResult | BaseException] = [
+                    await self.load_fixture(fixture_files[layer[0]], fixtures[layer[0]]),
+                ]
+            else:
+                results = await asyncio.gather(
+                    *(self._load_fixture_in_new_session(fixture_files[name], fixtures[name]) for name in layer),
+                    return_exceptions=True,
+                )
+
+            for name, result in zip(layer, results, strict=True):
+                if isinstance(result, BaseException):
+                    self.logger.error(f"Error loading fixture {name}: {result}")
+                    self.results[name] = FixtureResult(name)
+                    self.results[name].status = FixtureLoadStatus.FAILED
+                    self.results[name].errors.append(f"Fixture loading failed: {result!s}")
+                else:
+                    self.results[name] = result
 
-            if not result.is_successful and not ignore_errors:
-                self.logger.error(f"Stopping fixture loading due to failure in {fixture_file.name}")
+            failed = [name for name in layer if not self.results[name].is_successful]
+            if failed and not ignore_errors:
+                self.logger.error(f"Stopping fixture loading due to failure in {failed}")
                 break
 
+        await self._save_digests(
+            {
+                name: digests[name]
+                for name, result in self.results.items()
+                if result.status == FixtureLoadStatus.SUCCESS and name in digests
+            },
+        )
+
         # Log summary
         successful = sum(1 for r in self.results.values() if r.is_successful)
         total = len(self.results)
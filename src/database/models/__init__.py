@@ -1,4 +1,5 @@
 from .base import Base
+from .fixture_state import FixtureState
 from .glossary_term import GlossaryTerm
 
-__all__ = ["Base", "GlossaryTerm"]
+__all__ = ["Base", "FixtureState", "GlossaryTerm"]
@@ -1,4 +1,6 @@
-from sqlalchemy import String, Text
+from typing import Any
+
+from sqlalchemy import ColumnElement, Index, String, Text, func, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -6,7 +8,20 @@ from .base import Base
 
 class GlossaryTerm(Base):
     __tablename__ = "glossary_terms"
+    __table_args__ = (
+        # Expression must match search_vector() for the planner to use the index
+        Index(
+            "ix_glossary_terms_search_vector",
+            text("to_tsvector('simple', term || ' ' || definition)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    term: Mapped[str] = mapped_column(String(255))
+    term: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     definition: Mapped[str] = mapped_column(Text)
+
+    @classmethod
+    def search_vector(cls) -> ColumnElement[Any]:
+        """Full-text search document of a term, indexed on PostgreSQL"""
+        return func.to_tsvector(literal_column("'simple'"), cls.term + literal_column("' '") + cls.definition)
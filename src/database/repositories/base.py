@@ -1,7 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, Generic
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.types import ModelType
@@ -17,45 +17,60 @@ class BaseRepository(Generic[ModelType]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all(
+    async def get_count(self) -> int:
+        stmt = select(func.count()).select_from(self.model)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def get_all_with_count(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> tuple[Sequence[ModelType], int]:
+        return await self._get_page_with_count(select(self.model), self.get_count, limit, offset)
+
+    async def _get_page_with_count(
         self,
+        stmt: Select[tuple[ModelType]],
+        get_count: Callable[[], Awaitable[int]],
         limit: int | None = None,
         offset: int | None = None,
-    ) -> Sequence[ModelType]:
-        stmt = select(self.model)
+    ) -> tuple[Sequence[ModelType], int]:
+        """Fetch a page of the statement's results along with their total count in a single query"""
+        page = stmt.add_columns(func.count().over())
         if limit is not None:
-            stmt = stmt.limit(limit)
+            page = page.limit(limit)
         if offset is not None:
-            stmt = stmt.offset(offset)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
-
-    async def get_count(self) -> int:
-        stmt = select(func.count()).select_from(self.model)
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+            page = page.offset(offset)
+        result = await self.session.execute(page)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        # Window count isn't available for an empty page
+        return [], await get_count() if offset else 0
 
     async def create(self, **kwargs: Any) -> ModelType:
-        obj = self.model(**kwargs)
-        self.session.add(obj)
+        stmt = insert(self.model).values(**kwargs).returning(self.model)
+        result = await self.session.execute(stmt)
         await self.session.commit()
-        await self.session.refresh(obj)
-        return obj
+        return result.scalar_one()
 
     async def update(self, id: int, **kwargs: Any) -> ModelType | None:
-        obj = await self.get(id)
-        if obj:
-            for key, value in kwargs.items():
-                if hasattr(obj, key) and key not in ["id", "created_at", "updated_at"] and value is not None:
-                    setattr(obj, key, value)
-            await self.session.commit()
-            await self.session.refresh(obj)
-        return obj
+        values = {
+            key: value
+            for key, value in kwargs.items()
+            if hasattr(self.model, key) and key not in ["id", "created_at", "updated_at"] and value is not None
+        }
+        if not values:
+            return await self.get(id)
+
+        stmt = update(self.model).where(self.model.id == id).values(**values).returning(self.model)
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.scalar_one_or_none()
 
     async def delete(self, id: int) -> ModelType | None:
-        obj = await self.get(id)
-        if obj:
-            await self.session.delete(obj)
-            await self.session.commit()
-            return obj
-        return None
+        stmt = delete(self.model).where(self.model.id == id).returning(self.model)
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.scalar_one_or_none()
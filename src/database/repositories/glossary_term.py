@@ -1,12 +1,17 @@
-from typing import Sequence
+import re
+from typing import Any, Sequence
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import ColumnElement, Insert, func, insert, literal_column, or_, select, table
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import GlossaryTerm
 
 from .base import BaseRepository
 
+# FTS5 table indexing glossary terms on SQLite, kept in sync by triggers (see migrations)
+GLOSSARY_TERMS_FTS_TABLE = "glossary_terms_fts"
+
 
 class GlossaryTermRepository(BaseRepository[GlossaryTerm]):
     def __init__(self, session: AsyncSession):
@@ -17,33 +22,69 @@ class GlossaryTermRepository(BaseRepository[GlossaryTerm]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def create_many(self, rows: list[dict[str, Any]]) -> Sequence[GlossaryTerm]:
+        """Create terms that don't exist yet, skipping existing and repeated ones"""
+        new_rows: dict[str, dict[str, Any]] = {}
+        for row in rows:
+            new_rows.setdefault(row["term"], row)
+
+        stmt = select(GlossaryTerm.term).where(GlossaryTerm.term.in_(new_rows))
+        existing = await self.session.execute(stmt)
+        for term in existing.scalars():
+            del new_rows[term]
+        if not new_rows:
+            return []
+
+        # Terms created concurrently since the check above are skipped by the database
+        result = await self.session.execute(
+            self._insert_skipping_existing().returning(GlossaryTerm),
+            list(new_rows.values()),
+        )
+        created = result.scalars().all()
+        await self.session.commit()
+        return created
+
+    def _insert_skipping_existing(self) -> Insert:
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(GlossaryTerm).on_conflict_do_nothing(index_elements=[GlossaryTerm.term])
+        if dialect == "sqlite":
+            return sqlite.insert(GlossaryTerm).on_conflict_do_nothing(index_elements=[GlossaryTerm.term])
+        return insert(GlossaryTerm)
+
+    def _search_condition(self, query: str) -> ColumnElement[bool]:
+        words = re.findall(r"\w+", query)
+        dialect = self.session.get_bind().dialect.name
+
+        # Match terms containing words starting with every word of the query using full-text indexes
+        if words and dialect == "postgresql":
+            ts_query = " & ".join(f"{word}:*" for word in words)
+            return GlossaryTerm.search_vector().op("@@")(func.to_tsquery(literal_column("'simple'"), ts_query))
+        if words and dialect == "sqlite":
+            fts_query = " ".join(f'"{word}"*' for word in words)
+            return GlossaryTerm.id.in_(
+                select(literal_column("rowid"))
+                .select_from(table(GLOSSARY_TERMS_FTS_TABLE))
+                .where(literal_column(GLOSSARY_TERMS_FTS_TABLE).op("MATCH")(fts_query)),
+            )
+
+        return or_(
+            GlossaryTerm.term.ilike(f"%{query}%"),
+            GlossaryTerm.definition.ilike(f"%{query}%"),
+        )
+
     async def get_count(self, search_query: str | None = None) -> int:
         stmt = select(func.count()).select_from(GlossaryTerm)
         if search_query:
-            stmt = stmt.where(
-                or_(
-                    GlossaryTerm.term.ilike(f"%{search_query}%"),
-                    GlossaryTerm.definition.ilike(f"%{search_query}%"),
-                ),
-            )
+            stmt = stmt.where(self._search_condition(search_query))
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
-    async def search(
+    async def search_with_count(
         self,
         query: str,
         limit: int | None = None,
         offset: int | None = None,
-    ) -> Sequence[GlossaryTerm]:
-        stmt = select(GlossaryTerm).where(
-            or_(
-                GlossaryTerm.term.ilike(f"%{query}%"),
-                GlossaryTerm.definition.ilike(f"%{query}%"),
-            ),
-        )
-        if limit:
-            stmt = stmt.limit(limit)
-        if offset:
-            stmt = stmt.offset(offset)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+    ) -> tuple[Sequence[GlossaryTerm], int]:
+        stmt = select(GlossaryTerm).where(self._search_condition(query))
+        return await self._get_page_with_count(stmt, lambda: self.get_count(query), limit, offset)
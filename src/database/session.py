@@ -1,12 +1,40 @@
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG, future=True)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DEBUG,
+    future=True,
+    insertmanyvalues_page_size=1000,
+    # aiosqlite would use NullPool otherwise, opening a connection per session
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        """Let readers work alongside the writer and reduce fsync and read syscalls"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -17,6 +45,16 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+async def warm_up_pool() -> None:
+    """Open all pool connections up front, so requests don't wait for connection setup"""
+
+    async def connect() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(connect() for _ in range(settings.DATABASE_POOL_SIZE)))
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
@@ -14,3 +14,8 @@ class BadRequest(HTTPException):
 class ValidationError(HTTPException):
     def __init__(self, errors: dict[str, list[str]]):
         super().__init__(status_code=400, detail=errors)
+
+
+class ServiceUnavailable(HTTPException):
+    def __init__(self, message: str):
+        super().__init__(status_code=503, detail=message)
@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from logging import getLogger
 
 from fastapi import FastAPI
@@ -5,30 +8,69 @@ from fastapi import FastAPI
 from config import get_settings
 from database.fixtures import FIXTURES_DIR
 from database.fixtures.loader import FixtureLoader
-from database.session import AsyncSessionLocal
-from routes import glossary_router
+from database.session import AsyncSessionLocal, engine, warm_up_pool
+from middlewares import ResponseCache, ResponseCacheMiddleware
+from routes import glossary_router, health_router
 
 logger = getLogger(__name__)
 settings = get_settings()
-
-app = FastAPI(
-    title="Glossary API",
-    root_path="/api",
-    docs_url="/docs",
-    redoc_url="/redoc",
+response_cache = ResponseCache(
+    settings.RESPONSE_CACHE_MAX_AGE,
+    settings.RESPONSE_CACHE_MAX_SIZE,
+    settings.RESPONSE_CACHE_MAX_BYTES,
 )
 
 
-@app.on_event("startup")
-async def load_initial_data() -> None:
+async def load_initial_data(app: FastAPI) -> None:
     logger.info("Starting initial data load...")
-    async with AsyncSessionLocal() as session:
-        loader = FixtureLoader(session, "database.models", logger)
-        results = await loader.load_all_fixtures(FIXTURES_DIR)
-        if not all(results.values()):
-            logger.warning("Some fixtures failed to load: %s", {k: v for k, v in results.items() if not v})
+    try:
+        async with AsyncSessionLocal() as session:
+            loader = FixtureLoader(session, "database.models", logger)
+            results = await loader.load_all_fixtures(FIXTURES_DIR)
+
+        failed = {name: result.to_dict() for name, result in results.items() if not result.is_successful}
+        if failed:
+            logger.warning("Some fixtures failed to load: %s", failed)
         else:
             logger.info("Initial data load completed successfully!")
+    except Exception:
+        logger.exception("Initial data load failed")
+    finally:
+        # Load errors are only logged, so readiness just means the load has finished.
+        # Responses cached while fixtures were loading may be outdated
+        response_cache.clear()
+        app.state.fixtures_loaded = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await warm_up_pool()
+
+    # Load fixtures in the background to accept requests right away. Records created through the API
+    # in the meantime are updated by fixtures with the same unique fields, see FixtureLoader.load_fixture
+    app.state.fixtures_loaded = False
+    fixtures_task = asyncio.create_task(load_initial_data(app))
+    yield
+    fixtures_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await fixtures_task
 
+    await engine.dispose()
+
+
+app = FastAPI(
+    title="Glossary API",
+    root_path="/api",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+)
 
 app.include_router(glossary_router)
+app.include_router(health_router)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    prefixes=(glossary_router.prefix,),
+    params=("limit", "offset", "query"),
+)
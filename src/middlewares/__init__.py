@@ -0,0 +1,3 @@
+from .cache import ResponseCache, ResponseCacheMiddleware
+
+__all__ = ["ResponseCache", "ResponseCacheMiddleware"]
@@ -0,0 +1,133 @@
+import time
+from dataclasses import dataclass
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+
+CacheKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    expires_at: float
+
+
+class ResponseCache:
+    """In-memory storage of responses, dropped as a whole whenever cached data changes"""
+
+    def __init__(self, max_age: int, max_size: int, max_bytes: int):
+        self.max_age = max_age
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self._responses: dict[CacheKey, CachedResponse] = {}
+        self._bytes = 0
+
+    def get(self, key: CacheKey) -> CachedResponse | None:
+        response = self._responses.get(key)
+        if response is not None and response.expires_at < time.monotonic():
+            self._pop(key)
+            return None
+        return response
+
+    def set(self, key: CacheKey, status: int, headers: list[tuple[bytes, bytes]], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        if key in self._responses:
+            self._pop(key)
+        while self._responses and (len(self._responses) >= self.max_size or self._bytes + len(body) > self.max_bytes):
+            self._pop(next(iter(self._responses)))
+        self._responses[key] = CachedResponse(status, headers, body, time.monotonic() + self.max_age)
+        self._bytes += len(body)
+
+    def _pop(self, key: CacheKey) -> None:
+        self._bytes -= len(self._responses.pop(key).body)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._responses.clear()
+        self._bytes = 0
+
+
+class ResponseCacheMiddleware:
+    """
+    Caches successful GET responses for the given path prefixes, keyed by the given query parameters only.
+
+    Any successful request with another method to these prefixes clears the cache.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache, prefixes: tuple[str, ...], params: tuple[str, ...]):
+        self.app = app
+        self.cache = cache
+        self.prefixes = prefixes
+        self.params = frozenset(params)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        if not path.startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] not in CACHEABLE_METHODS:
+            await self._call_and_invalidate(scope, receive, send)
+            return
+
+        # Unknown parameters are ignored by the handlers, so they must not create separate entries
+        query = parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+        key = (scope["method"], path, tuple(sorted(item for item in query if item[0] in self.params)))
+        cached = self.cache.get(key)
+        if cached is not None:
+            await send({"type": "http.response.start", "status": cached.status, "headers": cached.headers})
+            await send({"type": "http.response.body", "body": cached.body})
+            return
+
+        await self._call_and_store(key, scope, receive, send)
+
+    async def _call_and_invalidate(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_wrapper(message: Message) -> None:
+            # Changes are committed once the response starts, clear the cache before the client sees it
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                self.cache.clear()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _call_and_store(self, key: CacheKey, scope: Scope, receive: Receive, send: Send) -> None:
+        # Responses started before the cache was cleared may hold stale data
+        generation = self.cache.generation
+        start: Message = {}
+        body: list[bytes] = []
+        body_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, body_size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                # Bodies too large to be cached aren't buffered at all
+                if body_size <= self.cache.max_bytes:
+                    body.append(chunk)
+                if (
+                    not message.get("more_body", False)
+                    and start.get("status") == 200
+                    and body_size <= self.cache.max_bytes
+                    and self.cache.generation == generation
+                ):
+                    self.cache.set(key, start["status"], list(start.get("headers", [])), b"".join(body))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
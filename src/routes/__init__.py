@@ -1,3 +1,4 @@
 from .glossary import router as glossary_router
+from .health import router as health_router
 
-__all__ = ["glossary_router"]
+__all__ = ["glossary_router", "health_router"]
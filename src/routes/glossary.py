@@ -1,25 +1,35 @@
 from fastapi import APIRouter, Query
 from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 
 from database.repositories.dependencies import CRUD
-from exceptions.glossary import GlossaryTermNotFound
+from exceptions.glossary import GlossaryTermAlreadyExists, GlossaryTermNotFound
 from schemas.common import PaginatedResponse, paginate
 from schemas.glossary_term import GlossaryTerm, GlossaryTermCreate, GlossaryTermUpdate
-from validators.glossary_term import GlossaryTermCreateValidator, GlossaryTermUpdateValidator
+from validators.glossary_term import (
+    GlossaryTermBatchCreateValidator,
+    GlossaryTermCreateValidator,
+    GlossaryTermUpdateValidator,
+)
 
 router = APIRouter(prefix="/glossary")
 
+MAX_PAGE_SIZE = 1000
+
+GLOSSARY_TERM_ADAPTER = TypeAdapter(GlossaryTerm)
+GLOSSARY_TERM_LIST_ADAPTER = TypeAdapter(list[GlossaryTerm])
+
 
 @router.get("/", response_model=PaginatedResponse[GlossaryTerm])
 async def get_glossary_terms(
     crud: CRUD,
-    limit: int = Query(50, ge=1),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
 ) -> PaginatedResponse[GlossaryTerm]:
-    result = await crud.glossary_term.get_all(limit, offset)
+    result, total = await crud.glossary_term.get_all_with_count(limit, offset)
     return paginate(
-        TypeAdapter(list[GlossaryTerm]).validate_python(result),
-        await crud.glossary_term.get_count(),
+        GLOSSARY_TERM_LIST_ADAPTER.validate_python(result),
+        total,
         limit,
     )
 
@@ -28,13 +38,13 @@ async def get_glossary_terms(
 async def search_glossary_terms(
     query: str,
     crud: CRUD,
-    limit: int = Query(50, ge=1),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
 ) -> PaginatedResponse[GlossaryTerm]:
-    result = await crud.glossary_term.search(query, limit, offset)
+    result, total = await crud.glossary_term.search_with_count(query, limit, offset)
     return paginate(
-        TypeAdapter(list[GlossaryTerm]).validate_python(result),
-        await crud.glossary_term.get_count(query),
+        GLOSSARY_TERM_LIST_ADAPTER.validate_python(result),
+        total,
         limit,
     )
 
@@ -47,7 +57,7 @@ async def get_glossary_term(
     result = await crud.glossary_term.get(id)
     if not result:
         raise GlossaryTermNotFound(id)
-    return TypeAdapter(GlossaryTerm).validate_python(result)
+    return GLOSSARY_TERM_ADAPTER.validate_python(result)
 
 
 @router.post("/")
@@ -55,11 +65,26 @@ async def create_glossary_term(
     crud: CRUD,
     glossary_term: GlossaryTermCreate,
 ) -> GlossaryTerm:
-    validator = GlossaryTermCreateValidator(glossary_term, crud)
-    await validator.validate()
+    validator = GlossaryTermCreateValidator(glossary_term)
+    validator.validate()
+
+    try:
+        result = await crud.glossary_term.create(**glossary_term.model_dump())
+    except IntegrityError:
+        raise GlossaryTermAlreadyExists(glossary_term.term)
+    return GLOSSARY_TERM_ADAPTER.validate_python(result)
+
+
+@router.post("/batch")
+async def create_glossary_terms(
+    crud: CRUD,
+    glossary_terms: list[GlossaryTermCreate],
+) -> list[GlossaryTerm]:
+    validator = GlossaryTermBatchCreateValidator(glossary_terms)
+    validator.validate()
 
-    result = await crud.glossary_term.create(**glossary_term.model_dump())
-    return TypeAdapter(GlossaryTerm).validate_python(result)
+    result = await crud.glossary_term.create_many([glossary_term.model_dump() for glossary_term in glossary_terms])
+    return GLOSSARY_TERM_LIST_ADAPTER.validate_python(result)
 
 
 @router.put("/{id}")
@@ -68,15 +93,16 @@ async def update_glossary_term(
     id: int,
     glossary_term: GlossaryTermUpdate,
 ) -> GlossaryTerm:
-    existing = await crud.glossary_term.get(id)
-    if not existing:
-        raise GlossaryTermNotFound(id)
-
-    validator = GlossaryTermUpdateValidator(glossary_term, id, crud)
-    await validator.validate()
+    validator = GlossaryTermUpdateValidator(glossary_term)
+    validator.validate()
 
-    result = await crud.glossary_term.update(id, **glossary_term.model_dump())
-    return TypeAdapter(GlossaryTerm).validate_python(result)
+    try:
+        result = await crud.glossary_term.update(id, **glossary_term.model_dump())
+    except IntegrityError:
+        raise GlossaryTermAlreadyExists(glossary_term.term)  # type: ignore[arg-type]
+    if not result:
+        raise GlossaryTermNotFound(id)
+    return GLOSSARY_TERM_ADAPTER.validate_python(result)
 
 
 @router.delete("/{id}")
@@ -87,4 +113,4 @@ async def delete_glossary_term(
     result = await crud.glossary_term.delete(id)
     if not result:
         raise GlossaryTermNotFound(id)
-    return TypeAdapter(GlossaryTerm).validate_python(result)
+    return GLOSSARY_TERM_ADAPTER.validate_python(result)
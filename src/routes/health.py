@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Request
+
+from exceptions.base import ServiceUnavailable
+
+router = APIRouter(prefix="/health")
+
+
+@router.get("/ready")
+async def get_readiness(request: Request) -> dict[str, str]:
+    if not request.app.state.fixtures_loaded:
+        raise ServiceUnavailable("Initial data is still loading")
+    return {"status": "ready"}